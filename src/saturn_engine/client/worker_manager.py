@@ -44,23 +44,25 @@ class WorkerManagerClient(AbstractWorkerManagerClient):
         self.selector: Optional[str] = selector
         self.http_client = http_client
         self.base_url = base_url
+        # The endpoints are fixed for the lifetime of the client, so build
+        # them once instead of on every request.
+        self.lock_url = urlcat(base_url, "api/lock")
+        self.sync_url = urlcat(base_url, "api/jobs/_states")
+        self.fetch_cursors_url = urlcat(base_url, "api/jobs/_states/fetch")
 
     async def lock(self) -> LockResponse:
-        lock_url = urlcat(self.base_url, "api/lock")
         json = asdict(LockInput(worker_id=self.worker_id, selector=self.selector))
-        async with self.http_client.post(lock_url, json=json) as response:
+        async with self.http_client.post(self.lock_url, json=json) as response:
             return fromdict(await response.json(), LockResponse)
 
     async def sync(self, sync: JobsStatesSyncInput) -> JobsStatesSyncResponse:
-        state_url = urlcat(self.base_url, "api/jobs/_states")
         json = asdict(sync)
-        async with self.http_client.put(state_url, json=json) as response:
+        async with self.http_client.put(self.sync_url, json=json) as response:
             return fromdict(await response.json(), JobsStatesSyncResponse)
 
     async def fetch_cursors_states(
         self, cursors: FetchCursorsStatesInput
     ) -> FetchCursorsStatesResponse:
-        state_url = urlcat(self.base_url, "api/jobs/_states/fetch")
         json = asdict(cursors)
-        async with self.http_client.post(state_url, json=json) as response:
+        async with self.http_client.post(self.fetch_cursors_url, json=json) as response:
             return fromdict(await response.json(), FetchCursorsStatesResponse)
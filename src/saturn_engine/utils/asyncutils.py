@@ -1,6 +1,7 @@
 import typing as t
 
 import asyncio
+import collections
 import contextlib
 from collections.abc import AsyncGenerator
 from collections.abc import AsyncIterator
@@ -39,44 +40,63 @@ class TasksGroup:
     ) -> None:
         self.logger = getLogger(__name__, self)
         self.tasks = set(tasks)
-        self.updated = asyncio.Event()
         self.name = name
 
-        self.updated_task: t.Optional[asyncio.Task] = None
+        # Completed tasks announce themselves through this queue, so `wait`
+        # doesn't have to rebuild a wait-set over all pending tasks.
+        # `None` is used as a sentinel to wake up `wait` on group updates.
+        self._done_queue: asyncio.Queue[t.Optional[asyncio.Task]] = asyncio.Queue()
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        for task in self.tasks:
+            task.add_done_callback(self._done_queue.put_nowait)
 
     def add(self, task: asyncio.Task) -> None:
         self.tasks.add(task)
-        self.notify()
+        # No wake-up needed: the done callback goes through the queue even
+        # if the task is already done when added.
+        task.add_done_callback(self._done_queue.put_nowait)
 
     def create_task(self, coroutine: Coroutine, **kwargs: t.Any) -> asyncio.Task:
-        task = asyncio.create_task(coroutine, **kwargs)
+        # Spawn from the cached loop to skip get_running_loop on every
+        # task creation.
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        task = loop.create_task(coroutine, **kwargs)
         self.add(task)
         return task
 
     def remove(self, task: asyncio.Task) -> None:
-        self.tasks.discard(task)
-        self.notify()
+        # Only notify for actual removals, so late or duplicate calls
+        # don't wake the waiters for nothing.
+        if task in self.tasks:
+            self.tasks.remove(task)
+            task.remove_done_callback(self._done_queue.put_nowait)
+            self.notify()
 
     def notify(self) -> None:
-        self.updated.set()
+        self._done_queue.put_nowait(None)
 
     async def wait(self, *, remove: bool = True) -> set[asyncio.Task]:
-        if self.updated_task is None:
-            name = f"task-group-{self.name}.wait" if self.name else "task-group.wait"
-            self.updated_task = asyncio.create_task(self.updated.wait(), name=name)
-
-        updated_task = self.updated_task
-        done, _ = await asyncio.wait(
-            self.tasks | {updated_task}, return_when=asyncio.FIRST_COMPLETED
-        )
-
-        if updated_task in done:
-            self.updated.clear()
-            done.remove(updated_task)
-            self.updated_task = None
+        done: set[asyncio.Task] = set()
+        task = await self._done_queue.get()
+        while True:
+            if task is not None:
+                done.add(task)
+            if self._done_queue.empty():
+                break
+            task = self._done_queue.get_nowait()
+
+        # Tasks removed from the group since their completion are discarded.
+        done &= self.tasks
 
         if remove:
             self.tasks.difference_update(done)
+        else:
+            # Completed tasks left in the group stay ready: re-enqueue
+            # them so later `wait` calls keep returning them.
+            for done_task in done:
+                self._done_queue.put_nowait(done_task)
         return done
 
     async def wait_all(self) -> set[asyncio.Task]:
@@ -87,12 +107,8 @@ class TasksGroup:
         return done
 
     async def close(self, timeout: t.Optional[float] = None) -> None:
-        # Cancel the update event task.
-        if self.updated_task:
-            self.updated_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.updated_task
-            self.updated_task = None
+        # Wake up any pending `wait` so it can notice the group is closing.
+        self.notify()
 
         if not self.tasks:
             return
@@ -172,12 +188,25 @@ class TasksGroupRunner(TasksGroup):
             self._log_tasks(done)
 
     def _log_tasks(self, tasks: set[asyncio.Task]) -> None:
+        # Tasks completing without error are the common case and don't log
+        # anything; fetch the exception once per task.
         for task in tasks:
-            if not task.cancelled() and isinstance(task.exception(), Exception):
-                self.logger.error("Task '%s' failed", task, exc_info=task.exception())
+            if task.cancelled():
+                continue
+            exception = task.exception()
+            if isinstance(exception, Exception):
+                self.logger.error("Task '%s' failed", task, exc_info=exception)
 
 
 class DelayedThrottle(t.Generic[AsyncFNone]):
+    """Throttle calls to `func`, delaying them by `delay` seconds.
+
+    Only the latest call's parameters are kept. The parameters are
+    snapshotted and cleared before `func` is awaited, so no state is
+    shared with an in-flight call: callers can keep queueing new delayed
+    calls while `func` is still running instead of serializing behind it.
+    """
+
     def __init__(self, func: AsyncFNone, *, delay: float) -> None:
         self.func = func
         self.delay = delay
@@ -222,8 +251,13 @@ class DelayedThrottle(t.Generic[AsyncFNone]):
         call_fut = None
         try:
             try:
-                with contextlib.suppress(asyncio.TimeoutError):
+                # try/except instead of contextlib.suppress: this runs for
+                # every delayed call and suppress allocates a context
+                # manager each time.
+                try:
                     await asyncio.wait_for(self.flush_event.wait(), timeout=self.delay)
+                except asyncio.TimeoutError:
+                    pass
             finally:
                 self.flush_event.clear()
                 # Ensure we set call_fut, even if the wait_for raised an exception.
@@ -258,8 +292,10 @@ class DelayedThrottle(t.Generic[AsyncFNone]):
             return
 
         self.delayed_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
+        try:
             await self.delayed_task
+        except asyncio.CancelledError:
+            pass
 
     async def flush(self, timeout: t.Optional[int] = None) -> None:
         if self.delayed_task is None:
@@ -302,6 +338,12 @@ class CachedProperty(t.Generic[T]):
     def __get__(self, instance: t.Any, owner: t.Any) -> t.Any:
         if instance is None:
             return self
+        # Once the value is computed, hand out the stored future directly:
+        # a done future can be awaited any number of times, and this skips
+        # the coroutine allocation of `_get_attribute` on cache hits.
+        future = instance.__dict__.get(self._name)
+        if future is not None:
+            return future
         return self._get_attribute(instance)
 
     def __delete__(self, instance: t.Any) -> None:
@@ -387,8 +429,12 @@ class SharedLock:
     """
 
     def __init__(self, *, max_reservations: int = 0):
-        self._lock = asyncio.Lock()
+        # The lock state is a plain reference plus a waiter deque instead
+        # of an asyncio.Lock: lockers and reservations only ever check it
+        # between awaits, so uncontended paths don't pay for the lock's
+        # future allocations.
         self._locker: t.Optional[object] = None
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
         if max_reservations:
             self._reservations_lock = asyncio.Semaphore(max_reservations)
         else:
@@ -397,8 +443,9 @@ class SharedLock:
     @contextlib.asynccontextmanager
     async def reserve(self) -> AsyncIterator["SharedLockReservation"]:
         async with self._reservations_lock:
-            async with self._lock:
-                reservation = SharedLockReservation(lock=self)
+            while self._locker is not None:
+                await self._wait_unlocked()
+            reservation = SharedLockReservation(lock=self)
 
             try:
                 yield reservation
@@ -406,16 +453,28 @@ class SharedLock:
                 reservation.release()
 
     def locked(self) -> bool:
-        return self._lock.locked()
+        return self._locker is not None
 
     def locked_reservations(self) -> bool:
         return self.locked() or self._reservations_lock.locked()
 
+    async def _wait_unlocked(self) -> None:
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
     async def _acquire(self, reservation: object) -> None:
         if self._locker is reservation:
             return
 
-        await self._lock.acquire()
+        while self._locker is not None:
+            await self._wait_unlocked()
         self._locker = reservation
 
     def _release(self, reservation: object) -> None:
@@ -423,10 +482,19 @@ class SharedLock:
             return
 
         self._locker = None
-        self._lock.release()
+        # Wake everyone and let them recheck: waiters can be either
+        # lockers or pending reservations.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
 
 
 class SharedLockReservation:
+    # One reservation is allocated per publish; keep it as small as a
+    # plain pointer.
+    __slots__ = ("_lock",)
+
     def __init__(self, *, lock: SharedLock) -> None:
         self._lock = lock
 
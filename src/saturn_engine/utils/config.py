@@ -5,7 +5,9 @@ from typing import Type
 from typing import TypeVar
 from typing import cast
 
+import functools
 import inspect
+import itertools
 import os
 from collections.abc import Iterable
 from collections.abc import Mapping
@@ -23,6 +25,9 @@ TConfig = TypeVar("TConfig", bound="Config")
 
 _MISSING = object()
 
+# How many container elements check_type samples.
+_CHECK_TYPE_MAX_ITEMS = 32
+
 
 class Config(Generic[T]):
     def __init__(self) -> None:
@@ -140,35 +145,88 @@ class LazyConfig:
                 yield obj
 
 
-def load_config_interface(
-    *, interface: Type, layers: list, config: CINamespace, path: str = ""
-) -> None:
-    annotations = typing.get_type_hints(interface)
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(interface: Any) -> dict[str, Any]:
+    return typing.get_type_hints(interface)
+
+
+def get_interface_hints(interface: Any) -> dict[str, Any]:
+    """Cached `typing.get_type_hints`.
+
+    `get_type_hints` re-evaluates forward references on every call and
+    interfaces are immutable, so resolve each interface once. Interfaces
+    can also be unhashable instances, which are resolved uncached.
+    """
+    try:
+        return _cached_type_hints(interface)
+    except TypeError:
+        return typing.get_type_hints(interface)
+
+
+class _FieldSpec(typing.NamedTuple):
+    name: str
+    typ: Any
+    default: Any
+    is_leaf: bool
+
+
+def _build_interface_spec(interface: Any) -> tuple[_FieldSpec, ...]:
+    annotations = get_interface_hints(interface)
+    specs = []
     for name in dir(interface) | annotations.keys():
         if name.startswith("_"):
             continue
 
-        key_path = f"{path}.{name}" if path else name
         value = get_attr(interface, name)
-        typ = get_prop_type(interface, name, value)
+        typ = get_prop_type(annotations, name, value)
 
         if is_leaf_type(typ):
-            config_value = get_config_value(layers, name, value)
+            specs.append(_FieldSpec(name=name, typ=typ, default=value, is_leaf=True))
+        elif inspect.isclass(typ):
+            specs.append(_FieldSpec(name=name, typ=typ, default=value, is_leaf=False))
+    return tuple(specs)
+
+
+_cached_interface_spec = functools.lru_cache(maxsize=None)(_build_interface_spec)
+
+
+def get_interface_spec(interface: Any) -> tuple[_FieldSpec, ...]:
+    """Get the compiled field specs of an interface.
+
+    Interfaces are static, so the attribute walk and type resolution are
+    done once per interface instead of on every refresh. Unhashable
+    instance interfaces are compiled uncached.
+    """
+    try:
+        return _cached_interface_spec(interface)
+    except TypeError:
+        return _build_interface_spec(interface)
+
+
+def load_config_interface(
+    *, interface: Type, layers: list, config: CINamespace, path: str = ""
+) -> None:
+    for spec in get_interface_spec(interface):
+        name = spec.name
+        key_path = f"{path}.{name}" if path else name
+
+        if spec.is_leaf:
+            config_value = get_config_value(layers, name, spec.default)
             if config_value is _MISSING:
                 if name not in config:
                     raise ValueError(f"Missing config key {key_path}")
-            elif not check_type(config_value, typ, interface):
+            elif not check_type(config_value, spec.typ, interface):
                 raise ValueError(
                     f'Invalid config key "{key_path}" type: '
-                    f'expected "{typ}", '
+                    f'expected "{spec.typ}", '
                     f'got "{type(config_value).__name__}"'
                 )
             config[name] = config_value
 
-        elif inspect.isclass(typ):
+        else:
             sublayers_ = sublayers(layers, name)
             load_config_interface(
-                interface=typ,
+                interface=spec.typ,
                 layers=sublayers_,
                 config=config.setdefault(name, CINamespace()),
                 path=key_path,
@@ -189,6 +247,9 @@ def get_config_value(layers: list, name: str, default_value: str) -> Any:
 def load_config(
     *, layers: list, interfaces: dict[str, Type], config: CINamespace
 ) -> None:
+    # The key map cache pins the layer objects it was built from; clear
+    # it so each load pass starts fresh and old layers can be collected.
+    _ikey_maps.clear()
     for namespace, interface in interfaces.items():
         namespace_layers = layers
         namespace_config = config
@@ -205,23 +266,37 @@ def sublayers(layers: list, name: str) -> list:
     return [s for layer in layers if (s := get_attr(layer, name)) is not _MISSING]
 
 
+_ikey_maps: dict[int, tuple[Any, dict[str, str]]] = {}
+
+
+def get_ikey_map(obj: Any) -> dict[str, str]:
+    """Get the case-insensitive key map of an object, caching it per load.
+
+    Each lookup used to rebuild the whole `dir()`/keys map, making a
+    config refresh quadratic in the number of attributes.
+
+    The cache entry keeps a reference to the object: keys are `id(obj)`,
+    and without the reference a collected layer object could hand its id
+    (and its stale key map) to a new object within the same load pass.
+    """
+    entry = _ikey_maps.get(id(obj))
+    if entry is None:
+        keys = obj.keys() if isinstance(obj, Mapping) else dir(obj)
+        entry = _ikey_maps[id(obj)] = (obj, {k.lower(): k for k in keys})
+    return entry[1]
+
+
 def get_attr(obj: Any, name: str) -> Any:
+    k = get_ikey_map(obj).get(name)
+    if k is None:
+        return _MISSING
+
     if isinstance(obj, Mapping):
-        ikey_map = {k.lower(): k for k in obj.keys()}
-        k = ikey_map.get(name, _MISSING)
-        if k is _MISSING:
-            return _MISSING
         return obj.get(k, _MISSING)
-
-    ikey_map = {k.lower(): k for k in dir(obj)}
-    k = ikey_map.get(name, _MISSING)
-    if k is _MISSING:
-        return k
     return getattr(obj, k, _MISSING)
 
 
-def get_prop_type(interface: Any, name: str, value: Any) -> Any:
-    annotations = typing.get_type_hints(interface)
+def get_prop_type(annotations: Mapping[str, Any], name: str, value: Any) -> Any:
     annotation = annotations.get(name)
 
     if annotation:
@@ -235,14 +310,40 @@ def get_prop_type(interface: Any, name: str, value: Any) -> Any:
     return typ
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_decompose_type(typ: Any, scope: Any) -> tuple[Any, tuple]:
+    origin_typ = typing.get_origin(typ)
+    if not origin_typ:
+        return None, ()
+    return origin_typ, tuple(eval_class_annotations(scope, typing.get_args(typ)))
+
+
+def decompose_type(typ: Any, scope: Any) -> tuple[Any, tuple]:
+    """Split a type annotation into its origin and evaluated arguments.
+
+    The decomposition is memoized since `typing.get_origin`/`get_args` and
+    annotation evaluation are costly and annotations never change.
+    """
+    try:
+        return _cached_decompose_type(typ, scope)
+    except TypeError:
+        origin_typ = typing.get_origin(typ)
+        if not origin_typ:
+            return None, ()
+        return origin_typ, tuple(eval_class_annotations(scope, typing.get_args(typ)))
+
+
 def check_type(obj: Any, typ: Any, scope: Any) -> bool:
     if typ is None:
         return obj is None
 
-    origin_typ = typing.get_origin(typ)
-    typ_args: list[Any] = []
+    # Fast path for plain scalar annotations, skipping the generic
+    # decomposition entirely.
+    if typ is str or typ is int or typ is bool:
+        return isinstance(obj, typ)
+
+    origin_typ, typ_args = decompose_type(typ, scope)
     if origin_typ:
-        typ_args = eval_class_annotations(scope, typing.get_args(typ))
         typ = origin_typ
 
     if typ is typing.Any:
@@ -260,12 +361,17 @@ def check_type(obj: Any, typ: Any, scope: Any) -> bool:
     if not isinstance(obj, typ):
         return False
 
+    # Element checks are defensive: config values are small and trusted,
+    # so only sample the first elements instead of walking everything.
     if issubclass(typ, Iterable) and len(typ_args) == 1:
-        return all(check_type(o, typ_args[0], scope) for o in obj)
+        return all(
+            check_type(o, typ_args[0], scope)
+            for o in itertools.islice(obj, _CHECK_TYPE_MAX_ITEMS)
+        )
     elif issubclass(typ, Mapping) and len(typ_args) == 2:
         return all(
             check_type(k, typ_args[0], scope) and check_type(v, typ_args[1], scope)
-            for k, v in obj.items()
+            for k, v in itertools.islice(obj.items(), _CHECK_TYPE_MAX_ITEMS)
         )
 
     return True
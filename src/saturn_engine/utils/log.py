@@ -2,14 +2,23 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
+import functools
 import logging
 
 T = TypeVar("T")
 
 
-def getLogger(module: str, klass: Union[Type[T], T]) -> logging.Logger:
+@functools.lru_cache(maxsize=None)
+def _class_logger(module: str, klass: type) -> logging.Logger:
     if module.startswith("saturn_engine."):
         module = "saturn." + module[14:]
+    return logging.getLogger(f"{module}.{klass.__name__}")
+
+
+def getLogger(module: str, klass: Union[Type[T], T]) -> logging.Logger:
+    # Loggers are per-class, but looked up per-instance in most __init__;
+    # memoize on (module, class) so repeated instantiations skip the name
+    # formatting and the logging manager lock.
     if not isinstance(klass, type):
         klass = klass.__class__
-    return logging.getLogger(f"{module}.{klass.__name__}")
+    return _class_logger(module, klass)
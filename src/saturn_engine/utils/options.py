@@ -53,11 +53,21 @@ def json_serializer(*args: t.Any, **kwargs: t.Any) -> str:
     return json.dumps(*args, default=pydantic.v1.json.pydantic_encoder, **kwargs)
 
 
+@cache
+def loader_for(klass: t.Type) -> t.Callable[[dict[str, t.Any]], t.Any]:
+    """Build the deserializer for a class once, so `fromdict` doesn't
+    re-classify the class on every call."""
+    schema = schema_for(t.cast(t.Hashable, klass))
+    if dataclasses.is_dataclass(klass):
+
+        def load(d: dict[str, t.Any]) -> t.Any:
+            return klass(**schema.parse_obj(d).dict())
+
+        return load
+    return schema.parse_obj
+
+
 def fromdict(
     d: dict[str, t.Any], klass: t.Type[T], *, config: t.Optional[dict] = None
 ) -> T:
-    schema = schema_for(t.cast(t.Hashable, klass))
-    obj: pydantic.v1.BaseModel = schema.parse_obj(d)
-    if dataclasses.is_dataclass(klass):
-        return t.cast(T, klass(**obj.dict()))
-    return t.cast(T, obj)
+    return t.cast(T, loader_for(t.cast(t.Hashable, klass))(d))
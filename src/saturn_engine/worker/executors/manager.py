@@ -106,10 +106,11 @@ class ExecutorWorker:
         self.executor_queue.start()
 
         # Go through all queue in the Ready state.
-        async for message in self.scheduler.run():
-            with message.saturn_context():
-                await self.services.s.hooks.message_scheduled.emit(message)
-                await self.executor_queue.submit(message)
+        async for messages in self.scheduler.run_batched():
+            for message in messages:
+                with message.saturn_context():
+                    await self.services.s.hooks.message_scheduled.emit(message)
+            await self.executor_queue.submit_batch(messages)
         self.logger.debug("Executor worker done")
 
     async def close(self) -> None:
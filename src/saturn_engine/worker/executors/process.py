@@ -30,6 +30,12 @@ def process_initializer(
     executor_initialized: EventHook[PipelineBootstrap],
     pool_type: PoolType,
 ) -> None:
+    """Warm up a pool worker at spawn time.
+
+    The bootstrap is built once per worker so messages don't pay its cost.
+    Services needing more warm-up (e.g. preloading pipeline modules) can
+    register on the `executor_initialized` hook, which runs here.
+    """
     global _bootstraper
 
     if pool_type is PoolType.PROCESS:
@@ -50,6 +56,7 @@ class ProcessExecutor(Executor):
 
     def __init__(self, options: Options, services: Services) -> None:
         self.max_workers = options.max_workers or os.cpu_count() or 1
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
 
         pool_cls: t.Union[
             t.Type[concurrent.futures.ProcessPoolExecutor],
@@ -70,9 +77,14 @@ class ProcessExecutor(Executor):
         )
 
     async def process_message(self, message: ExecutableMessage) -> PipelineResults:
-        loop = asyncio.get_running_loop()
-        execute = partial(self.remote_execute, message=message.message.as_remote())
-        return await loop.run_in_executor(self.pool_executor, execute)
+        # The loop lookup and argument binding happen on every message, so
+        # cache the former and let run_in_executor bind the latter.
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool_executor, self.remote_execute, message.message.as_remote()
+        )
 
     @property
     def concurrency(self) -> int:
@@ -83,7 +95,7 @@ class ProcessExecutor(Executor):
 
     @staticmethod
     def remote_execute(message: PipelineMessage) -> PipelineResults:
-        if not _bootstraper:
+        if _bootstraper is None:
             raise ValueError("process_initializer must be called")
         with wrap_remote_exception():
             return _bootstraper.bootstrap_pipeline(message)
@@ -142,21 +142,31 @@ class ExecutorQueue:
         # Get the lock to ensure we don't acquire resource if the submit queue
         # is already full.
         async with self.submit_lock:
-            # Try first to check if we have the resources available so we can
-            # then check if the executor queue is ready. That way, the scheduler
-            # will pause until the executor is free again.
-            if await self.acquire_resources(processable, wait=False):
-                await self.queue_submit(processable)
-            else:
-                # Park the queue from which the processable comes from.
-                # The queue should be unparked once the resources are acquired.
-                processable.park()
-                # To avoid blocking the executor queue while we wait on resource,
-                # create a background task to wait on resources.
-                self.submit_tasks.create_task(
-                    self.delayed_submit(processable),
-                    name=f"delayed-submit({processable})",
-                )
+            await self._submit_locked(processable)
+
+    async def submit_batch(self, processables: list[ExecutableMessage]) -> None:
+        # Amortize the submit lock acquisition over a whole batch of
+        # messages that got scheduled together.
+        async with self.submit_lock:
+            for processable in processables:
+                await self._submit_locked(processable)
+
+    async def _submit_locked(self, processable: ExecutableMessage) -> None:
+        # Try first to check if we have the resources available so we can
+        # then check if the executor queue is ready. That way, the scheduler
+        # will pause until the executor is free again.
+        if await self.acquire_resources(processable, wait=False):
+            await self.queue_submit(processable)
+        else:
+            # Park the queue from which the processable comes from.
+            # The queue should be unparked once the resources are acquired.
+            processable.park()
+            # To avoid blocking the executor queue while we wait on resource,
+            # create a background task to wait on resources.
+            self.submit_tasks.create_task(
+                self.delayed_submit(processable),
+                name=f"delayed-submit({processable})",
+            )
 
     async def acquire_resources(
         self, processable: ExecutableMessage, *, wait: bool
@@ -2,6 +2,7 @@ import typing as t
 
 import asyncio
 import dataclasses
+import logging
 from collections.abc import AsyncGenerator
 from collections.abc import AsyncIterator
 from collections.abc import Coroutine
@@ -62,9 +63,24 @@ class Scheduler(t.Generic[T]):
     async def close(self) -> None:
         self.is_running = False
 
+        schedule_slots = list(self.schedule_slots.values())
+        self.schedule_slots.clear()
+
+        # Close idle generators before cancelling their pending `anext`
+        # task. Cancelling a not-yet-started `asend` throws CancelledError
+        # inside the generator, which would prevent `aclose` from
+        # delivering GeneratorExit.
+        busy_slots = []
+        for schedule_slot in schedule_slots:
+            schedule_slot.is_running = False
+            if getattr(schedule_slot.generator, "ag_running", False):
+                busy_slots.append(schedule_slot)
+            else:
+                await self.stop_slot_generator(schedule_slot)
+
         await self.tasks_group.close()
-        for item in self.schedule_slots.values():
-            self.stop_slot(item)
+        for schedule_slot in busy_slots:
+            await self.stop_slot_generator(schedule_slot)
 
     def stop_slot(self, schedule_slot: ScheduleSlot[T]) -> None:
         schedule_slot.is_running = False
@@ -81,6 +97,16 @@ class Scheduler(t.Generic[T]):
             schedule_slot.future.set_result(None)
 
     async def run(self) -> AsyncIterator[T]:
+        async for batch in self.run_batched():
+            for item in batch:
+                yield item
+
+    async def run_batched(self) -> AsyncIterator[list[T]]:
+        """Like `run`, but yield all the items that got ready together.
+
+        This allows consumers to amortize per-item costs over a whole
+        batch of ready items.
+        """
         if self.is_running is False:
             return
 
@@ -89,14 +115,20 @@ class Scheduler(t.Generic[T]):
             done = await self.tasks_group.wait()
             if not done:
                 continue
-            self.logger.debug(
-                "task ready",
-                extra={"data": {"tasks": ",".join(t.get_name() for t in done)}},
-            )
-
+            # The join over task names runs even when debug is off; skip
+            # it entirely on the per-batch path unless it's enabled.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "task ready",
+                    extra={"data": {"tasks": ",".join(t.get_name() for t in done)}},
+                )
+
+            batch: list[T] = []
             for task in sorted(done, key=self.task_order):
                 async for item in self.process_task(task):
-                    yield item
+                    batch.append(item)
+            if batch:
+                yield batch
 
     async def process_task(self, task: asyncio.Task) -> AsyncIterator[T]:
         item = self.tasks[task]
@@ -106,6 +138,8 @@ class Scheduler(t.Generic[T]):
             # Even if the task finished, if the item was removed we
             # discard the item.
             if task.cancelled() or item not in self.schedule_slots:
+                # A stopped slot's generator still must be closed.
+                await self._close_stopped_slot(item)
                 return
 
             exception = task.exception()
@@ -140,6 +174,12 @@ class Scheduler(t.Generic[T]):
                 else:
                     await self._requeue_task(item=item, schedule_slot=schedule_slot)
 
+    async def _close_stopped_slot(self, item: SchedulableProtocol[T]) -> None:
+        schedule_slot = self.schedule_slots.get(item)
+        if schedule_slot and not schedule_slot.is_running:
+            del self.schedule_slots[item]
+            await self.stop_slot_generator(schedule_slot)
+
     async def _requeue_task(
         self, *, item: SchedulableProtocol[T], schedule_slot: ScheduleSlot[T]
     ) -> None:
@@ -40,11 +40,14 @@ class Item:
     )
 
     def as_topic_message(self) -> TopicMessage:
+        # Merge in a single allocation. The message needs its own dict:
+        # consumers mutate message metadata, so a shared mapping view
+        # would leak writes across messages.
         return TopicMessage(
             id=self.id,
             args=self.args,
             tags=self.tags,
-            metadata=self.metadata | {"job": {"cursor": self.cursor}},
+            metadata={**self.metadata, "job": {"cursor": self.cursor}},
             config=self.config,
         )
 
@@ -1,15 +1,37 @@
+import dataclasses
+
 import aiohttp
 
 from saturn_engine.utils.options import json_serializer
 
-from . import MinimalService
+from . import BaseServices
+from . import Service
 
 
-class HttpClient(MinimalService):
+class HttpClient(Service[BaseServices, "HttpClient.Options"]):
     name = "http_client"
 
+    @dataclasses.dataclass
+    class Options:
+        #: Connection pool size. All saturn services share this one
+        #: session, so keep-alive connections are reused across jobs
+        #: instead of paying a TCP handshake per request.
+        connector_limit: int = 100
+        #: Per-host connection cap; 0 leaves it unbounded.
+        connector_limit_per_host: int = 0
+        #: How long idle keep-alive connections are kept around.
+        keepalive_timeout: float = 60.0
+
     async def open(self) -> None:
-        self.session = aiohttp.ClientSession(json_serialize=json_serializer)
+        connector = aiohttp.TCPConnector(
+            limit=self.options.connector_limit,
+            limit_per_host=self.options.connector_limit_per_host,
+            keepalive_timeout=self.options.keepalive_timeout,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=json_serializer,
+        )
 
     async def close(self) -> None:
         await self.session.close()
@@ -169,7 +169,10 @@ class JobStateService(Service[Services, Options]):
         return states
 
     def _maybe_flush(self) -> None:
-        if self.options.auto_flush:
+        if self.options.auto_flush and not self._delayed_flush.is_waiting:
+            # A pending flush covers any new writes: flush() reads the
+            # store when it fires, so there's no need to re-arm it on
+            # every state update.
             self._delayed_flush.call_nowait()
 
     async def flush(self) -> None:
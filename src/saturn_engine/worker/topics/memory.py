@@ -1,17 +1,116 @@
 from typing import Any
 from typing import AsyncContextManager
+from typing import Optional
 
 import asyncio
+import collections
 import dataclasses
 from collections.abc import AsyncGenerator
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from types import TracebackType
 
 from saturn_engine.core import TopicMessage
 
 from . import Topic
 
-_memory_queues: dict[str, asyncio.Queue] = {}
+
+class SimpleQueue:
+    """Minimal asyncio.Queue replacement for the in-process transport.
+
+    Producer and consumer share the event loop here, so the common case
+    never blocks: put/get are an append/popleft without the per-waiter
+    future bookkeeping asyncio.Queue does. Blocked peers are woken
+    through events and recheck in a loop.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "_items",
+        "_not_empty",
+        "_not_full",
+        "_all_done",
+        "_unfinished",
+    )
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items: collections.deque = collections.deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+        self._unfinished = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._unfinished += 1
+        self._all_done.clear()
+        self._not_empty.set()
+
+    async def put(self, item: Any) -> None:
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._all_done.set()
+
+    async def join(self) -> None:
+        await self._all_done.wait()
+
+
+_memory_queues: dict[str, SimpleQueue] = {}
+
+
+class MessageContext:
+    """Hand-written context manager: one is created per consumed message,
+    and a plain object is cheaper than an asynccontextmanager generator.
+    """
+
+    __slots__ = ("message", "queue")
+
+    def __init__(self, message: TopicMessage, queue: SimpleQueue) -> None:
+        self.message = message
+        self.queue = queue
+
+    async def __aenter__(self) -> TopicMessage:
+        return self.message
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.queue.task_done()
 
 
 @dataclasses.dataclass
@@ -34,32 +133,28 @@ class MemoryTopic(Topic):
             message = await queue.get()
             yield self.message_context(message, queue=queue)
 
-    @asynccontextmanager
-    async def message_context(
-        self, message: TopicMessage, queue: asyncio.Queue
-    ) -> AsyncIterator[TopicMessage]:
-        try:
-            yield message
-        finally:
-            queue.task_done()
+    def message_context(
+        self, message: TopicMessage, queue: SimpleQueue
+    ) -> MessageContext:
+        return MessageContext(message, queue)
 
     async def publish(self, message: TopicMessage, wait: bool) -> bool:
         queue = get_queue(self.options.name, maxsize=self.options.buffer_size)
-        if wait:
-            await queue.put(message)
-        else:
-            try:
-                queue.put_nowait(message)
-                return True
-            except asyncio.QueueFull:
+        try:
+            # Common case: the queue has capacity, no need to suspend.
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            if not wait:
                 return False
+            await queue.put(message)
         return True
 
 
-def get_queue(queue_id: str, *, maxsize: int = 100) -> asyncio.Queue:
-    if queue_id not in _memory_queues:
-        _memory_queues[queue_id] = asyncio.Queue(maxsize=maxsize)
-    return _memory_queues[queue_id]
+def get_queue(queue_id: str, *, maxsize: int = 100) -> SimpleQueue:
+    queue = _memory_queues.get(queue_id)
+    if queue is None:
+        queue = _memory_queues[queue_id] = SimpleQueue(maxsize=maxsize)
+    return queue
 
 
 async def join_all() -> None:
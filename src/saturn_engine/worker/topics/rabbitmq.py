@@ -7,17 +7,20 @@ import enum
 import json
 import pickle  # noqa: S403
 from collections.abc import AsyncGenerator
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
 from datetime import timedelta
+from types import TracebackType
 
 import aio_pika
 import aio_pika.abc
 import aio_pika.exceptions
+import aio_pika.pool
+import aiormq.abc
 from opentelemetry.metrics import get_meter
 
 from saturn_engine.core import TopicMessage
+from saturn_engine.utils.asyncutils import DelayedThrottle
 from saturn_engine.utils.asyncutils import SharedLock
+from saturn_engine.utils.asyncutils import SharedLockReservation
 from saturn_engine.utils.asyncutils import cached_property
 from saturn_engine.utils.log import getLogger
 from saturn_engine.utils.lru import LRUDefaultDict
@@ -29,6 +32,20 @@ from saturn_engine.worker.services.rabbitmq import RabbitMQService
 from ..topic import Topic
 from ..topic import TopicClosedError
 
+try:
+    import orjson
+
+    def _json_dumps(obj: t.Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: t.Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
 
 class RabbitMQSerializer(enum.Enum):
     JSON = "json"
@@ -52,6 +69,8 @@ ContentTypeToSerializer: dict[str, RabbitMQSerializer] = {
     v: k for k, v in SerializerToContentType.items()
 }
 
+_PERSISTENT_MODE = aio_pika.DeliveryMode.PERSISTENT
+
 
 @dataclasses.dataclass
 class Exchange:
@@ -70,6 +89,7 @@ class RabbitMQTopic(Topic):
 
     RETRY_PUBLISH_DELAY = timedelta(seconds=10)
     FAILURE_RETRY_BACKOFFS = [timedelta(seconds=s) for s in (0, 5, 10, 20, 30, 60)]
+    _BACKOFF_SECONDS = tuple(d.total_seconds() for d in FAILURE_RETRY_BACKOFFS)
 
     @dataclasses.dataclass
     class Options:
@@ -80,7 +100,18 @@ class RabbitMQTopic(Topic):
         max_length: t.Optional[int] = None
         max_length_bytes: t.Optional[int] = None
         overflow: t.Optional[str] = "reject-publish"
-        prefetch_count: t.Optional[int] = 1
+        #: How many unacked deliveries the broker keeps in flight. Bounded
+        #: but large enough to keep the consumer busy; 1 serializes every
+        #: delivery behind an ack round-trip, None leaves the broker
+        #: unbounded and buffers locally without limit.
+        prefetch_count: int = 100
+        global_prefetch: bool = False
+        ack_batch_size: int = 1
+        ack_batch_interval: float = 1.0
+        #: How many channels publishes are spread over. One channel
+        #: serializes concurrent publishers behind its confirm
+        #: round-trips; a small pool lets them overlap.
+        channel_pool_size: int = 4
         serializer: RabbitMQSerializer = RabbitMQSerializer.JSON
         log_above_size: t.Optional[int] = None
         max_publish_concurrency: int = 0
@@ -107,6 +138,29 @@ class RabbitMQTopic(Topic):
             cache_len=1024, default_factory=lambda: 0
         )
 
+        # Batched ack state. Messages settle out of order, so settled tags
+        # are recorded until they form a contiguous range from
+        # `_ack_floor`, which can then be acked in one basic.ack with
+        # multiple=True.
+        self._pending_tags: dict[int, bool] = {}
+        self._ack_floor = 0
+        self._unflushed_ack: t.Optional[int] = None
+        self._unflushed_count = 0
+        self._ack_channel: t.Optional[aiormq.abc.AbstractChannel] = None
+        self._delayed_ack_flush = DelayedThrottle(
+            self._flush_acks, delay=options.ack_batch_interval
+        )
+
+        # Per-publish constants, resolved once instead of in the hot loop.
+        self._routing_key = options.routing_key or options.queue_name
+        self._content_type = options.serializer.content_type
+
+        # Exchange objects are channel-bound; cache one per pooled
+        # channel. Bounded by the pool size.
+        self._pool_exchanges: dict[
+            aio_pika.abc.AbstractChannel, aio_pika.abc.AbstractExchange
+        ] = {}
+
         self.queue_arguments: dict[str, t.Any] = self.options.arguments
 
         if self.options.max_length:
@@ -175,20 +229,24 @@ class RabbitMQTopic(Topic):
             return False
 
         async with self._publish_lock.reserve() as reservation:
+            body = self._serialize(message)
             while True:
-                body = self._serialize(message)
                 try:
-                    await self.ensure_queue()  # Ensure the queue is created.
-                    exchange = await self.exchange
-                    await exchange.publish(
-                        aio_pika.Message(
-                            body=body,
-                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                            content_type=self.options.serializer.content_type,
-                            expiration=message.expire_after,
-                        ),
-                        routing_key=self.options.routing_key or self.options.queue_name,
-                    )
+                    # Declaring the queue also declares the exchange and
+                    # binds them; a single cached await once resolved.
+                    await self.ensure_queue()
+                    channel_pool = await self.channel_pool
+                    async with channel_pool.acquire() as channel:
+                        exchange = await self._exchange_for(channel)
+                        await exchange.publish(
+                            aio_pika.Message(
+                                body=body,
+                                delivery_mode=_PERSISTENT_MODE,
+                                content_type=self._content_type,
+                                expiration=message.expire_after,
+                            ),
+                            routing_key=self._routing_key,
+                        )
                     self.publish_bytes_counter.add(len(body), {"topic": self.name})
                     return True
                 except aio_pika.exceptions.DeliveryError as e:
@@ -202,13 +260,7 @@ class RabbitMQTopic(Topic):
                     if not wait:
                         return False
 
-                    # If the lock is being help by another task, we can assume
-                    # that once the control is being yielded to this task it
-                    # will be after successfully publishing a message, therefor
-                    # there's no need to sleep.
-                    has_locked = reservation.locked() or not self._publish_lock.locked()
-                    await reservation.acquire()
-                    if has_locked:
+                    if await self._acquire_publish_retry(reservation):
                         await asyncio.sleep(self.RETRY_PUBLISH_DELAY.total_seconds())
                     attempt = 0
                 except Exception:
@@ -216,45 +268,81 @@ class RabbitMQTopic(Topic):
                     if not wait:
                         raise
 
-                    # If the lock is being help by another task, we can assume
-                    # that once the control is being yielded to this task it
-                    # will be after successfully publishing a message, therefor
-                    # there's no need to sleep.
-                    has_locked = reservation.locked() or not self._publish_lock.locked()
-                    await reservation.acquire()
-                    if has_locked:
+                    if await self._acquire_publish_retry(reservation):
                         if not await self.backoff_sleep(attempt):
                             raise
                         attempt += 1
 
-            return False
+    async def _acquire_publish_retry(self, reservation: SharedLockReservation) -> bool:
+        """Take the publish lock before retrying.
+
+        Return whether the retry should sleep first. If the lock is being
+        held by another task, we can assume that once the control is being
+        yielded to this task it will be after successfully publishing a
+        message, therefor there's no need to sleep.
+        """
+        has_locked = reservation.locked() or not self._publish_lock.locked()
+        await reservation.acquire()
+        return has_locked
 
     async def backoff_sleep(self, attempt: int) -> bool:
-        if attempt >= len(self.FAILURE_RETRY_BACKOFFS):
+        if attempt >= len(self._BACKOFF_SECONDS):
             return False
-        retry_delay = self.FAILURE_RETRY_BACKOFFS[attempt]
-        await asyncio.sleep(retry_delay.total_seconds())
+        await asyncio.sleep(self._BACKOFF_SECONDS[attempt])
         return True
 
-    @asynccontextmanager
-    async def message_context(
+    def message_context(
         self, message: aio_pika.abc.AbstractIncomingMessage
-    ) -> AsyncIterator[TopicMessage]:
-        requeue: bool = False
-        if message.message_id and self.options.max_retry:
-            requeue = (
-                self.attempt_by_message.get(message.message_id, 0)
-                < self.options.max_retry
-            )
-        async with message.process(requeue=requeue):
-            try:
-                yield self._deserialize(message)
-            except Exception:
-                if message.message_id and self.options.max_retry:
-                    self.attempt_by_message[message.message_id] += 1
-                raise
-            if message.message_id:
-                self.attempt_by_message.pop(message.message_id, None)
+    ) -> "MessageContext":
+        return MessageContext(self, message)
+
+    async def _settle(
+        self,
+        message: aio_pika.abc.AbstractIncomingMessage,
+        *,
+        ack: bool,
+        requeue: bool = False,
+    ) -> None:
+        tag = message.delivery_tag
+        if tag is None:
+            if ack:
+                await message.ack()
+            else:
+                await message.reject(requeue=requeue)
+            return
+
+        if not ack:
+            # Rejects are sent right away; they only take part in the
+            # floor tracking so later acks don't cover them.
+            await message.reject(requeue=requeue)
+
+        self._ack_channel = message.channel
+        self._pending_tags[tag] = ack
+        while (next_tag := self._ack_floor + 1) in self._pending_tags:
+            if self._pending_tags.pop(next_tag):
+                self._unflushed_ack = next_tag
+                self._unflushed_count += 1
+            self._ack_floor = next_tag
+
+        if self._unflushed_count >= self.options.ack_batch_size:
+            await self._flush_acks()
+        elif self._unflushed_ack is not None:
+            self._delayed_ack_flush.call_nowait()
+
+    async def _flush_acks(self) -> None:
+        tag = self._unflushed_ack
+        channel = self._ack_channel
+        if tag is None or channel is None:
+            return
+
+        self._unflushed_ack = None
+        self._unflushed_count = 0
+        try:
+            await channel.basic_ack(delivery_tag=tag, multiple=True)
+        except Exception:
+            # The channel died; the broker will redeliver the unacked
+            # messages once the consumer reconnects.
+            self.logger.exception("Failed to ack messages")
 
     @cached_property
     async def channel(self) -> aio_pika.abc.AbstractChannel:
@@ -267,8 +355,10 @@ class RabbitMQTopic(Topic):
             connection.channel(on_return_raises=True)  # type: ignore[arg-type]
         )
 
-        if self.options.prefetch_count is not None:
-            await channel.set_qos(prefetch_count=self.options.prefetch_count)
+        await channel.set_qos(
+            prefetch_count=self.options.prefetch_count,
+            global_=self.options.global_prefetch,
+        )
         channel.close_callbacks.add(self.channel_closed)
         channel.reopen_callbacks.add(self.channel_reopened)
         return channel
@@ -291,6 +381,44 @@ class RabbitMQTopic(Topic):
     async def ensure_exchange(self) -> aio_pika.abc.AbstractExchange:
         return await self.exchange
 
+    @cached_property
+    async def channel_pool(self) -> aio_pika.pool.Pool:
+        # Publishes go through a small channel pool so concurrent
+        # publishers aren't serialized behind one channel's confirm
+        # round-trips. Consumers keep the dedicated QoS channel.
+        connection = await self.services.s.rabbitmq.connections.get(
+            self.options.connection_name
+        )
+
+        async def get_channel() -> aio_pika.abc.AbstractChannel:
+            return await connection.channel(on_return_raises=True)
+
+        pool: aio_pika.pool.Pool = aio_pika.pool.Pool(
+            get_channel, max_size=self.options.channel_pool_size
+        )
+        self.exit_stack.push_async_callback(pool.close)
+        return pool
+
+    async def _exchange_for(
+        self, channel: aio_pika.abc.AbstractChannel
+    ) -> aio_pika.abc.AbstractExchange:
+        exchange = self._pool_exchanges.get(channel)
+        if exchange is None:
+            if self.options.exchange:
+                exchange = await channel.declare_exchange(
+                    name=self.options.exchange.name,
+                    type=self.options.exchange.type,
+                    durable=self.options.exchange.durable,
+                    passive=self.options.exchange.passive,
+                    auto_delete=self.options.exchange.auto_delete,
+                    arguments=self.options.exchange.arguments,
+                    timeout=self.options.exchange.timeout,
+                )
+            else:
+                exchange = channel.default_exchange
+            self._pool_exchanges[channel] = exchange
+        return exchange
+
     def channel_closed(
         self, channel: aio_pika.abc.AbstractChannel, reason: t.Optional[Exception]
     ) -> None:
@@ -304,6 +432,13 @@ class RabbitMQTopic(Topic):
         self.logger.info(
             "Channel reopening", extra={"data": {"topic": {"id": self.name}}}
         )
+        # Delivery tags reset on a new channel; drop any batched ack state
+        # from the old one. Unacked messages get redelivered.
+        self._pending_tags.clear()
+        self._ack_floor = 0
+        self._unflushed_ack = None
+        self._unflushed_count = 0
+        self._ack_channel = None
 
     @cached_property
     async def queue(self) -> aio_pika.abc.AbstractQueue:
@@ -318,7 +453,7 @@ class RabbitMQTopic(Topic):
         if self.options.exchange:
             await queue.bind(
                 self.options.exchange.name,
-                routing_key=self.options.routing_key or self.options.queue_name,
+                routing_key=self._routing_key,
                 arguments=self.options.bind_arguments,
             )
 
@@ -329,13 +464,15 @@ class RabbitMQTopic(Topic):
 
     async def close(self) -> None:
         self.is_closed = True
+        await self._delayed_ack_flush.cancel()
+        await self._flush_acks()
         await self.exit_stack.aclose()
 
     def _serialize(self, message: TopicMessage) -> bytes:
         if self.options.serializer == RabbitMQSerializer.PICKLE:
             serialized_message = pickle.dumps(message)
         else:
-            serialized_message = json.dumps(asdict(message)).encode()
+            serialized_message = _json_dumps(asdict(message))
 
         serialized_message_len = len(serialized_message)
         if (
@@ -373,4 +510,60 @@ class RabbitMQTopic(Topic):
                 raise Exception("Deserialized RabbitMQ message is not a TopicMessage.")
             return deserialized
 
-        return fromdict(json.loads(message.body.decode()), TopicMessage)
+        return fromdict(_json_loads(message.body), TopicMessage)
+
+
+class MessageContext:
+    """Hand-written context manager for one consumed delivery.
+
+    One is created per message; a plain object with __slots__ is cheaper
+    than an asynccontextmanager generator on the per-message path.
+    """
+
+    __slots__ = ("topic", "message")
+
+    def __init__(
+        self,
+        topic: RabbitMQTopic,
+        message: aio_pika.abc.AbstractIncomingMessage,
+    ) -> None:
+        self.topic = topic
+        self.message = message
+
+    async def __aenter__(self) -> TopicMessage:
+        try:
+            return self.topic._deserialize(self.message)
+        except BaseException as e:
+            await self.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: t.Optional[type[BaseException]],
+        exc_value: t.Optional[BaseException],
+        traceback: t.Optional[TracebackType],
+    ) -> None:
+        topic = self.topic
+        message = self.message
+        options = topic.options
+
+        if exc_type is None:
+            if options.ack_batch_size > 1:
+                await topic._settle(message, ack=True)
+            else:
+                await message.ack()
+            if message.message_id:
+                topic.attempt_by_message.pop(message.message_id, None)
+            return
+
+        requeue = False
+        if message.message_id and options.max_retry:
+            requeue = (
+                topic.attempt_by_message.get(message.message_id, 0) < options.max_retry
+            )
+            if issubclass(exc_type, Exception):
+                topic.attempt_by_message[message.message_id] += 1
+        if options.ack_batch_size > 1:
+            await topic._settle(message, ack=False, requeue=requeue)
+        else:
+            await message.reject(requeue=requeue)
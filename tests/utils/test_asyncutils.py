@@ -8,6 +8,8 @@ from unittest.mock import Mock
 import pytest
 
 from saturn_engine.utils.asyncutils import DelayedThrottle
+from saturn_engine.utils.asyncutils import SharedLock
+from saturn_engine.utils.asyncutils import TasksGroup
 from saturn_engine.utils.asyncutils import opened_acontext
 
 
@@ -162,6 +164,169 @@ async def test_delayed_throttle_wait() -> None:
     assert (await t3) == 3
 
 
+async def test_tasks_group_wait() -> None:
+    e1 = asyncio.Event()
+    e2 = asyncio.Event()
+    group = TasksGroup()
+    t1 = group.create_task(e1.wait())
+    t2 = group.create_task(e2.wait())
+
+    # Nothing completed yet: wait blocks.
+    wait_task = asyncio.create_task(group.wait())
+    await asyncio.sleep(1)
+    assert not wait_task.done()
+
+    e1.set()
+    assert await wait_task == {t1}
+    assert t1 not in group.tasks
+    assert t2 in group.tasks
+
+    e2.set()
+    assert await group.wait() == {t2}
+    assert not group.tasks
+    await group.close()
+
+
+async def test_tasks_group_wait_no_remove() -> None:
+    async def one() -> int:
+        return 1
+
+    group = TasksGroup()
+    task = group.create_task(one())
+
+    # With remove=False the task stays in the group and every subsequent
+    # wait returns it again.
+    assert await group.wait(remove=False) == {task}
+    assert task in group.tasks
+    assert await group.wait(remove=False) == {task}
+
+    assert await group.wait() == {task}
+    assert not group.tasks
+    await group.close()
+
+
+async def test_tasks_group_add_done_task() -> None:
+    async def one() -> int:
+        return 1
+
+    task = asyncio.create_task(one())
+    await task
+
+    # Tasks that completed before being added are still returned.
+    group = TasksGroup()
+    group.add(task)
+    assert await group.wait() == {task}
+    await group.close()
+
+
+async def test_tasks_group_remove() -> None:
+    event = asyncio.Event()
+    group = TasksGroup()
+    task = group.create_task(event.wait())
+
+    # Removing a task wakes up a pending wait with no result.
+    wait_task = asyncio.create_task(group.wait())
+    await asyncio.sleep(1)
+    assert not wait_task.done()
+    group.remove(task)
+    assert await wait_task == set()
+
+    # The removed task completing doesn't show up in the group.
+    event.set()
+    await task
+
+    # Removing a task that isn't in the group is a no-op and doesn't
+    # wake waiters.
+    group.remove(task)
+    wait_task = asyncio.create_task(group.wait())
+    await asyncio.sleep(1)
+    assert not wait_task.done()
+
+    group.notify()
+    assert await wait_task == set()
+    await group.close()
+
+
+async def test_tasks_group_close() -> None:
+    group = TasksGroup()
+    task = group.create_task(asyncio.Event().wait())
+    await group.close()
+    assert task.cancelled()
+    assert not group.tasks
+
+
+async def test_shared_lock() -> None:
+    lock = SharedLock()
+    entered = asyncio.Event()
+
+    async def reserve_and_enter() -> None:
+        async with lock.reserve():
+            entered.set()
+
+    async with lock.reserve() as reservation:
+        assert not lock.locked()
+        await reservation.acquire()
+        assert lock.locked()
+        assert reservation.locked()
+        # The reservation holding the lock can re-acquire without
+        # blocking.
+        await reservation.acquire()
+
+        # New reservations block while the lock is held.
+        task = asyncio.create_task(reserve_and_enter())
+        await asyncio.sleep(1)
+        assert not entered.is_set()
+
+        # Releasing wakes them up.
+        reservation.release()
+        assert not lock.locked()
+        await task
+        assert entered.is_set()
+
+    assert not lock.locked()
+
+
+async def test_shared_lock_acquire_contention() -> None:
+    lock = SharedLock()
+    async with AsyncExitStack() as stack:
+        r1 = await stack.enter_async_context(lock.reserve())
+        r2 = await stack.enter_async_context(lock.reserve())
+
+        await r1.acquire()
+
+        # Another reservation's acquire blocks until the locker releases.
+        acquire_task = asyncio.create_task(r2.acquire())
+        await asyncio.sleep(1)
+        assert not acquire_task.done()
+        assert not r2.locked()
+
+        r1.release()
+        await acquire_task
+        assert r2.locked()
+
+
+async def test_shared_lock_max_reservations() -> None:
+    lock = SharedLock(max_reservations=1)
+    entered = asyncio.Event()
+
+    async def reserve_and_enter() -> None:
+        async with lock.reserve():
+            entered.set()
+
+    assert not lock.locked_reservations()
+    async with lock.reserve():
+        assert lock.locked_reservations()
+
+        # Reservations above the limit wait for a slot.
+        task = asyncio.create_task(reserve_and_enter())
+        await asyncio.sleep(1)
+        assert not entered.is_set()
+
+    await task
+    assert entered.is_set()
+    assert not lock.locked_reservations()
+
+
 async def test_opened_acontext() -> None:
     mock = Mock()
 
@@ -4,7 +4,9 @@ import asyncio
 from collections.abc import Awaitable
 from datetime import datetime
 from datetime import timedelta
+from unittest.mock import Mock
 
+import aio_pika.abc
 import asyncstdlib as alib
 import pytest
 from aiormq.exceptions import AMQPConnectionError
@@ -13,6 +15,7 @@ from saturn_engine.config import Config
 from saturn_engine.core import MessageId
 from saturn_engine.core import TopicMessage
 from saturn_engine.utils import utcnow
+from saturn_engine.worker.services import Services
 from saturn_engine.worker.services.manager import ServicesManager
 from saturn_engine.worker.services.rabbitmq import RabbitMQService
 from saturn_engine.worker.topic import TopicClosedError
@@ -310,3 +313,313 @@ async def test_create_topic_with_exchange(
     )
 
     await topic.ensure_queue()
+
+
+# The settlement logic below is pure bookkeeping over the message and
+# channel interfaces, so it is tested without a broker through fakes.
+
+
+class FakeAckChannel:
+    def __init__(self) -> None:
+        self.acks: list[tuple[int, bool]] = []
+
+    async def basic_ack(self, delivery_tag: int, multiple: bool = False) -> None:
+        self.acks.append((delivery_tag, multiple))
+
+
+class FakeIncomingMessage:
+    def __init__(
+        self,
+        *,
+        body: bytes = b"",
+        delivery_tag: t.Optional[int] = None,
+        message_id: t.Optional[str] = None,
+        content_type: str = "application/json",
+        channel: t.Optional[FakeAckChannel] = None,
+    ) -> None:
+        self.body = body
+        self.delivery_tag = delivery_tag
+        self.message_id = message_id
+        self.content_type = content_type
+        self.channel = channel
+        self.acked = 0
+        self.rejections: list[bool] = []
+
+    async def ack(self) -> None:
+        self.acked += 1
+
+    async def reject(self, requeue: bool = False) -> None:
+        self.rejections.append(requeue)
+
+
+def as_incoming(
+    message: FakeIncomingMessage,
+) -> aio_pika.abc.AbstractIncomingMessage:
+    return t.cast(aio_pika.abc.AbstractIncomingMessage, message)
+
+
+@pytest.fixture
+def offline_rabbitmq_topic_maker() -> t.Callable[..., RabbitMQTopic]:
+    def maker(**kwargs: t.Any) -> RabbitMQTopic:
+        options = RabbitMQTopic.Options(queue_name="test", **kwargs)
+        # The topic only resolves the rabbitmq service when connecting;
+        # a stub entry satisfies the namespace cast.
+        services = Services(rabbitmq=object())
+        topic = RabbitMQTopic(options, services=services)
+        topic.name = "test"
+        return topic
+
+    return maker
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_ack_batching(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=3, ack_batch_interval=100)
+    channel = FakeAckChannel()
+
+    def message(tag: int) -> aio_pika.abc.AbstractIncomingMessage:
+        return as_incoming(FakeIncomingMessage(delivery_tag=tag, channel=channel))
+
+    # Nothing is acked until a full batch is settled.
+    await topic._settle(message(1), ack=True)
+    await topic._settle(message(2), ack=True)
+    assert channel.acks == []
+    await topic._settle(message(3), ack=True)
+    assert channel.acks == [(3, True)]
+
+    # Out-of-order settlements are held until the range from the floor
+    # is contiguous.
+    await topic._settle(message(5), ack=True)
+    await topic._settle(message(6), ack=True)
+    await topic._settle(message(7), ack=True)
+    assert channel.acks == [(3, True)]
+    await topic._settle(message(4), ack=True)
+    assert channel.acks == [(3, True), (7, True)]
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_ack_batching_rejects(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=2, ack_batch_interval=100)
+    channel = FakeAckChannel()
+    rejected = FakeIncomingMessage(delivery_tag=1, channel=channel)
+
+    # Rejects are sent right away, but still advance the ack floor so
+    # later batched acks don't cover them.
+    await topic._settle(as_incoming(rejected), ack=False, requeue=True)
+    assert rejected.rejections == [True]
+    assert channel.acks == []
+
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=2, channel=channel)), ack=True
+    )
+    assert channel.acks == []
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=3, channel=channel)), ack=True
+    )
+    assert channel.acks == [(3, True)]
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_ack_batching_interval(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    # A partial batch is flushed after ack_batch_interval.
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=100, ack_batch_interval=5)
+    channel = FakeAckChannel()
+
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=1, channel=channel)), ack=True
+    )
+    assert channel.acks == []
+    await asyncio.sleep(6)
+    assert channel.acks == [(1, True)]
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_ack_batching_close_flushes(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=100, ack_batch_interval=100)
+    channel = FakeAckChannel()
+
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=1, channel=channel)), ack=True
+    )
+    assert channel.acks == []
+    await topic.close()
+    assert channel.acks == [(1, True)]
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_ack_batching_channel_reopened(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=2, ack_batch_interval=100)
+    old_channel = FakeAckChannel()
+
+    # An out-of-order tag is pending when the channel reopens.
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=2, channel=old_channel)),
+        ack=True,
+    )
+
+    # Delivery tags restart on the new channel; the old state must not
+    # leak into it.
+    topic.channel_reopened(Mock())
+    new_channel = FakeAckChannel()
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=1, channel=new_channel)),
+        ack=True,
+    )
+    assert new_channel.acks == []
+    await topic._settle(
+        as_incoming(FakeIncomingMessage(delivery_tag=2, channel=new_channel)),
+        ack=True,
+    )
+    assert new_channel.acks == [(2, True)]
+    assert old_channel.acks == []
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_context_success(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker()
+    message = TopicMessage(id=MessageId("0"), args={"n": 1})
+    incoming = FakeIncomingMessage(
+        body=topic._serialize(message), message_id="0", delivery_tag=1
+    )
+
+    async with topic.message_context(as_incoming(incoming)) as received:
+        assert received == message
+
+    assert incoming.acked == 1
+    assert incoming.rejections == []
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_context_failure(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    topic = offline_rabbitmq_topic_maker(max_retry=1)
+    message = TopicMessage(id=MessageId("0"), args={"n": 1})
+    body = topic._serialize(message)
+
+    # A failing message is requeued while it has attempts left.
+    incoming = FakeIncomingMessage(body=body, message_id="0", delivery_tag=1)
+    with pytest.raises(ValueError):
+        async with topic.message_context(as_incoming(incoming)):
+            raise ValueError("Pipeline failed")
+    assert incoming.acked == 0
+    assert incoming.rejections == [True]
+
+    # Once max_retry is exhausted it is rejected for good.
+    incoming = FakeIncomingMessage(body=body, message_id="0", delivery_tag=2)
+    with pytest.raises(ValueError):
+        async with topic.message_context(as_incoming(incoming)):
+            raise ValueError("Pipeline failed")
+    assert incoming.rejections == [False]
+
+    # Success clears the attempt counter.
+    incoming = FakeIncomingMessage(body=body, message_id="0", delivery_tag=3)
+    async with topic.message_context(as_incoming(incoming)):
+        pass
+    assert incoming.acked == 1
+    assert topic.attempt_by_message.get("0") is None
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_context_cancellation(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    # Cancellation requeues the message without consuming an attempt.
+    topic = offline_rabbitmq_topic_maker(max_retry=1)
+    message = TopicMessage(id=MessageId("0"), args={"n": 1})
+    incoming = FakeIncomingMessage(
+        body=topic._serialize(message), message_id="0", delivery_tag=1
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        async with topic.message_context(as_incoming(incoming)):
+            raise asyncio.CancelledError()
+    assert incoming.rejections == [True]
+    assert topic.attempt_by_message.get("0") is None
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_context_deserialize_error(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    # A message failing to deserialize raises on enter and is rejected.
+    topic = offline_rabbitmq_topic_maker()
+    incoming = FakeIncomingMessage(body=b"not json", message_id="0", delivery_tag=1)
+
+    with pytest.raises(ValueError):
+        async with topic.message_context(as_incoming(incoming)):
+            pytest.fail("The context should not be entered")
+    assert incoming.acked == 0
+    assert incoming.rejections == [False]
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_context_batched_settle(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    # With batching enabled the context settles through the batched path.
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=2, ack_batch_interval=100)
+    channel = FakeAckChannel()
+    message = TopicMessage(id=MessageId("0"), args={"n": 1})
+    body = topic._serialize(message)
+
+    incomings = [
+        FakeIncomingMessage(
+            body=body, message_id=str(tag), delivery_tag=tag, channel=channel
+        )
+        for tag in (1, 2)
+    ]
+    for incoming in incomings:
+        async with topic.message_context(as_incoming(incoming)):
+            pass
+
+    assert all(incoming.acked == 0 for incoming in incomings)
+    assert channel.acks == [(2, True)]
+
+    await topic.close()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_topic_settle_without_delivery_tag(
+    offline_rabbitmq_topic_maker: t.Callable[..., RabbitMQTopic]
+) -> None:
+    # Messages without a delivery tag fall back to per-message settling.
+    topic = offline_rabbitmq_topic_maker(ack_batch_size=10, ack_batch_interval=100)
+
+    acked = FakeIncomingMessage()
+    await topic._settle(as_incoming(acked), ack=True)
+    assert acked.acked == 1
+
+    rejected = FakeIncomingMessage()
+    await topic._settle(as_incoming(rejected), ack=False, requeue=True)
+    assert rejected.rejections == [True]
+
+    await topic.close()